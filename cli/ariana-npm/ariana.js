@@ -1,5 +1,5 @@
 #!/usr/bin/env node
-const { execFileSync, spawnSync, spawn } = require('child_process');
+const { spawn } = require('child_process');
 const path = require('path');
 const os = require('os');
 const fs = require('fs');
@@ -16,7 +16,7 @@ function checkLatestVersion() {
       hostname: 'registry.npmjs.org',
       path: '/ariana',
       method: 'GET',
-      timeout: 3000
+      timeout: 1500
     };
 
     const req = https.request(options, (res) => {
@@ -133,13 +133,22 @@ try {
   
   // Use different execution strategies depending on platform
   if (platform === 'win32') {
-    // On Windows, execFileSync works well
-    try {
-      execFileSync(binaryPath, args, { stdio: 'inherit' });
-    } catch (err) {
+    // On Windows, spawn like the other platforms so Node exits with the child
+    // and the background version check can finish while the binary runs
+    const childProcess = spawn(binaryPath, args, {
+      stdio: 'inherit',
+      windowsHide: true
+    });
+
+    childProcess.on('error', (err) => {
       console.error(err.message);
+      printBinaryInfo();
       process.exit(1);
-    }
+    });
+
+    childProcess.on('exit', (code) => {
+      process.exit(code || 0);
+    });
   } else if (platform === 'darwin') {
     // On macOS, try various methods starting with the most reliable
     console.log(`Executing on macOS: ${binaryPath} with args: ${args.join(' ')}`);
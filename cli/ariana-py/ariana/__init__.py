@@ -2,16 +2,47 @@ import os
 import subprocess
 import sys
 import platform
+import functools
 import json
+import threading
+import time
 import urllib.request
 from urllib.error import URLError
 
+VERSION_CACHE_FILE = os.path.join(os.path.expanduser('~'), '.cache', 'ariana', 'latest.json')
+VERSION_CACHE_TTL = 6 * 60 * 60  # seconds
+
+def _read_cached_version():
+    try:
+        with open(VERSION_CACHE_FILE, 'r') as f:
+            cached = json.load(f)
+        if time.time() - cached.get('checked_at', 0) < VERSION_CACHE_TTL:
+            return cached.get('version')
+    except (OSError, ValueError):
+        pass
+    return None
+
+def _write_cached_version(version):
+    try:
+        os.makedirs(os.path.dirname(VERSION_CACHE_FILE), exist_ok=True)
+        with open(VERSION_CACHE_FILE, 'w') as f:
+            json.dump({'version': version, 'checked_at': time.time()}, f)
+    except OSError:
+        pass
+
+@functools.lru_cache(maxsize=1)
 def check_latest_version():
+    cached = _read_cached_version()
+    if cached is not None:
+        return cached
     try:
         url = "https://pypi.org/pypi/ariana/json"
-        with urllib.request.urlopen(url, timeout=3) as response:
+        with urllib.request.urlopen(url, timeout=1.5) as response:
             data = json.loads(response.read().decode())
-            return data.get("info", {}).get("version")
+            version = data.get("info", {}).get("version")
+            if version:
+                _write_cached_version(version)
+            return version
     except (URLError, json.JSONDecodeError, KeyError) as e:
         print(f"Warning: Failed to check for latest version: {e}")
         return None
@@ -57,21 +88,26 @@ def main():
             print(f"Warning: Could not set execute permissions on {binary}: {e}")
             # Continue anyway, the binary might already be executable
 
-    try:
-        latest_version = check_latest_version()
+    # Check the registry on a daemon thread so CLI startup never waits on the network
+    version_result = []
+    version_thread = threading.Thread(target=lambda: version_result.append(check_latest_version()), daemon=True)
+    version_thread.start()
+
+    process = subprocess.Popen([binary] + sys.argv[1:])
+    return_code = process.wait()
+
+    # Only warn if the check finished while the binary was running; otherwise drop it
+    version_thread.join(timeout=0)
+    if not version_thread.is_alive() and version_result:
+        latest_version = version_result[0]
         if latest_version and latest_version != '0.5.2':
             print('\033[33m\u26A0  WARNING: You are using an outdated version of Ariana CLI\033[0m')
             print(f'\033[33mYour version: 0.5.2\033[0m')
             print(f'\033[33mLatest version: {latest_version}\033[0m')
             print('\033[33mPlease update to the latest version using: pip install --upgrade ariana\033[0m')
-    except Exception:
-        # Silently fail if version check fails
-        pass
 
-    try:
-        subprocess.run([binary] + sys.argv[1:], check=True)
-    except subprocess.CalledProcessError as e:
-        sys.exit(1)
+    if return_code != 0:
+        sys.exit(return_code)
 
 if __name__ == '__main__':
     main()
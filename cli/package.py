@@ -5,13 +5,19 @@ import platform
 import subprocess
 import re
 import json
+import functools
+import hashlib
+import threading
 import urllib.request
+from pathlib import Path
+from string import Template
+from concurrent.futures import ThreadPoolExecutor, wait
 from urllib.error import URLError
 
 # Configuration
-BINARY_DIR = "binaries"  # Directory containing your prebuilt Rust binaries
-NPM_DIR = "ariana-npm"
-PIP_DIR = "ariana-py"
+BINARY_DIR = Path("binaries")  # Directory containing your prebuilt Rust binaries
+NPM_DIR = Path("ariana-npm")
+PIP_DIR = Path("ariana-py")
 BINARIES = {
     "linux-x64": "ariana-linux-x64",
     "linux-arm64": "ariana-linux-arm64",
@@ -19,9 +25,21 @@ BINARIES = {
     "macos-arm64": "ariana-macos-arm64",
     "windows": "ariana-windows-x64.exe",
 }
-VSCODE_README_PATH = "../extensions/vscode/README.md"  # Path to the VS Code extension README
+VSCODE_README_PATH = Path("../extensions/vscode/README.md")  # Path to the VS Code extension README
+PACKAGE_CACHE_DIR = Path(".ariana_package_cache")  # Holds the input fingerprint of the last run
 
-# Function to check for the latest version
+# platform.system() shells out to uname on some platforms; resolve it once
+IS_WINDOWS = platform.system().lower() == "windows"
+
+# Copies run on worker threads, so serialize prints to keep log lines whole
+PRINT_LOCK = threading.Lock()
+
+def log(message):
+    with PRINT_LOCK:
+        print(message)
+
+# Function to check for the latest version (one registry round-trip per package type)
+@functools.lru_cache(maxsize=4)
 def get_latest_version(package_type):
     try:
         if package_type == "npm":
@@ -39,17 +57,110 @@ def get_latest_version(package_type):
         print(f"Warning: Failed to check for latest version: {e}")
         return None
 
+_DRIVE_LETTER_RE = re.compile(r'^[A-Za-z]:')
+
+# Win32 access constants used to mirror what Git Bash's chmod 755 does on NTFS
+GENERIC_READ = 0x80000000
+GENERIC_EXECUTE = 0x20000000
+GRANT_ACCESS = 1
+NO_INHERITANCE = 0
+TRUSTEE_IS_SID = 0
+TRUSTEE_IS_WELL_KNOWN_GROUP = 5
+SE_FILE_OBJECT = 1
+DACL_SECURITY_INFORMATION = 0x00000004
+
+_everyone_sid = None
+
+def _get_everyone_sid(ctypes, advapi32):
+    # The Everyone SID ("S-1-1-0") never changes, so convert it once per process
+    global _everyone_sid
+    if _everyone_sid is None:
+        sid = ctypes.c_void_p()
+        if not advapi32.ConvertStringSidToSidW("S-1-1-0", ctypes.byref(sid)):
+            return None
+        _everyone_sid = sid
+    return _everyone_sid
+
+# Grant Everyone read+execute through the Win32 ACL APIs directly, skipping the
+# ~100ms Git Bash process spawn per file; returns False so callers can fall back
+def set_executable_acl(file_path):
+    if os.name != 'nt':
+        return False
+    try:
+        import ctypes
+        from ctypes import wintypes
+
+        advapi32 = ctypes.WinDLL('advapi32', use_last_error=True)
+        kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+
+        class TRUSTEE_W(ctypes.Structure):
+            _fields_ = [
+                ('pMultipleTrustee', ctypes.c_void_p),
+                ('MultipleTrusteeOperation', wintypes.DWORD),
+                ('TrusteeForm', wintypes.DWORD),
+                ('TrusteeType', wintypes.DWORD),
+                ('ptstrName', ctypes.c_void_p),
+            ]
+
+        class EXPLICIT_ACCESS_W(ctypes.Structure):
+            _fields_ = [
+                ('grfAccessPermissions', wintypes.DWORD),
+                ('grfAccessMode', wintypes.DWORD),
+                ('grfInheritance', wintypes.DWORD),
+                ('Trustee', TRUSTEE_W),
+            ]
+
+        sid = _get_everyone_sid(ctypes, advapi32)
+        if sid is None:
+            return False
+
+        old_dacl = ctypes.c_void_p()
+        security_descriptor = ctypes.c_void_p()
+        if advapi32.GetNamedSecurityInfoW(
+            str(file_path), SE_FILE_OBJECT, DACL_SECURITY_INFORMATION,
+            None, None, ctypes.byref(old_dacl), None,
+            ctypes.byref(security_descriptor),
+        ) != 0:
+            return False
+
+        access = EXPLICIT_ACCESS_W()
+        access.grfAccessPermissions = GENERIC_READ | GENERIC_EXECUTE
+        access.grfAccessMode = GRANT_ACCESS
+        access.grfInheritance = NO_INHERITANCE
+        access.Trustee.TrusteeForm = TRUSTEE_IS_SID
+        access.Trustee.TrusteeType = TRUSTEE_IS_WELL_KNOWN_GROUP
+        access.Trustee.ptstrName = sid
+
+        new_dacl = ctypes.c_void_p()
+        try:
+            if advapi32.SetEntriesInAclW(1, ctypes.byref(access), old_dacl, ctypes.byref(new_dacl)) != 0:
+                return False
+            result = advapi32.SetNamedSecurityInfoW(
+                str(file_path), SE_FILE_OBJECT, DACL_SECURITY_INFORMATION,
+                None, None, new_dacl, None)
+            if result == 0:
+                log(f"Set execute ACL on {file_path}")
+                return True
+            return False
+        finally:
+            kernel32.LocalFree(security_descriptor)
+            if new_dacl:
+                kernel32.LocalFree(new_dacl)
+    except Exception as e:
+        log(f"Warning: Could not set execute ACL on {file_path}: {e}")
+        return False
+
 # Helper function to set executable permissions using Git Bash on Windows
 def set_executable_with_git_bash(file_path):
     try:
         # Convert Windows path to Git Bash compatible path
         git_bash_path = file_path.replace('\\', '/')
         # Check if the path starts with a drive letter and convert it to Git Bash format
-        if re.match(r'^[A-Za-z]:', git_bash_path):
+        if _DRIVE_LETTER_RE.match(git_bash_path):
             drive_letter = git_bash_path[0].lower()
             git_bash_path = f"/{drive_letter}{git_bash_path[2:]}"
         
-        print(f"Attempting to set executable permissions using Git Bash on {file_path}")
+        log(f"Attempting to set executable permissions using Git Bash on {file_path}")
         result = subprocess.run(
             ["bash", "-c", f"chmod 755 '{git_bash_path}'"], 
             stdout=subprocess.PIPE, 
@@ -57,23 +168,26 @@ def set_executable_with_git_bash(file_path):
             text=True
         )
         if result.returncode == 0:
-            print("Successfully set executable permissions using Git Bash")
+            log("Successfully set executable permissions using Git Bash")
             return True
         else:
-            print(f"Warning: Git Bash chmod failed: {result.stderr}")
+            log(f"Warning: Git Bash chmod failed: {result.stderr}")
             return False
     except Exception as e:
-        print(f"Warning: Could not set executable permissions using Git Bash: {e}")
-        print("This is normal on Windows and should not affect functionality.")
+        log(f"Warning: Could not set executable permissions using Git Bash: {e}")
+        log("This is normal on Windows and should not affect functionality.")
         return False
 
-# Get version from Cargo.toml
+_VERSION_RE = re.compile(r'version\s*=\s*"([^"]+)"')
+
+# Get version from Cargo.toml (parsed once, reused on later calls)
+@functools.lru_cache(maxsize=1)
 def get_version_from_cargo():
     cargo_path = "Cargo.toml"
     try:
         with open(cargo_path, 'r') as f:
             content = f.read()
-            version_match = re.search(r'version\s*=\s*"([^"]+)"', content)
+            version_match = _VERSION_RE.search(content)
             if version_match:
                 return version_match.group(1)
             else:
@@ -83,56 +197,132 @@ def get_version_from_cargo():
         print(f"Error reading Cargo.toml: {e}")
         return "0.1.0"
 
-# Get version
-VERSION = get_version_from_cargo()
+# Resolve VERSION lazily so importing this script does not hit Cargo.toml
+def __getattr__(name):
+    if name == 'VERSION':
+        version = get_version_from_cargo()
+        globals()['VERSION'] = version
+        return version
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Ensure the script is run from the correct directory
 def ensure_dir(directory):
     os.makedirs(directory, exist_ok=True)
 
+# Fingerprint everything the packagers consume (plus this script, so template
+# changes invalidate the cache) from mtime+size, cheap enough to run every time
+def package_inputs_key():
+    inputs = [Path("Cargo.toml"), VSCODE_README_PATH, Path(__file__)]
+    inputs += [BINARY_DIR / binary for binary in BINARIES.values()]
+    stats = []
+    for path in inputs:
+        try:
+            st = os.stat(path)
+            stats.append((str(path), st.st_mtime_ns, st.st_size))
+        except OSError:
+            continue
+    return hashlib.blake2b(repr(sorted(stats)).encode()).hexdigest()
+
+def package_cache_hit(key):
+    return (PACKAGE_CACHE_DIR / f"{key}.json").exists()
+
+def write_package_cache(key):
+    ensure_dir(PACKAGE_CACHE_DIR)
+    # Drop stale fingerprints so the directory only ever holds the latest run
+    for entry in os.scandir(PACKAGE_CACHE_DIR):
+        os.remove(entry.path)
+    with open(PACKAGE_CACHE_DIR / f"{key}.json", "w") as f:
+        json.dump({"key": key}, f)
+
+# Copy file contents with large blocks to keep syscall count low on multi-MB binaries
+def copy_file_contents(src, dst):
+    if IS_WINDOWS:
+        # CPython 3.8+ routes this through CopyFileW, the fastest path on Windows
+        shutil.copyfile(src, dst)
+        return
+    with open(src, 'rb') as s, open(dst, 'wb') as d:
+        if hasattr(os, 'sendfile'):
+            # Zero-copy kernel transfer on Linux/macOS
+            remaining = os.fstat(s.fileno()).st_size
+            offset = 0
+            try:
+                while remaining > 0:
+                    sent = os.sendfile(d.fileno(), s.fileno(), offset, remaining)
+                    if sent == 0:
+                        break
+                    offset += sent
+                    remaining -= sent
+                return
+            except OSError:
+                # Some filesystems refuse sendfile; fall back to buffered copy
+                s.seek(0)
+                d.seek(0)
+                d.truncate()
+        shutil.copyfileobj(s, d, length=4 * 1024 * 1024)
+
 # Copy binary to target directory with executable permissions
 def copy_binary(src, dst):
-    shutil.copy(src, dst)
-    
-    if platform.system().lower() != "windows":
+    copy_file_contents(src, dst)
+    # Carry over timestamps/mode like shutil.copy2 so repeated runs stay cheap to compare
+    shutil.copystat(src, dst)
+
+    if not IS_WINDOWS:
         try:
-            # Make sure to set executable permissions for user, group, and others on Unix-like systems
-            os.chmod(dst, 0o755)  # rwxr-xr-x
-            print(f"Set executable permissions (0755) on {dst}")
+            # Make sure executable permissions are set for user, group, and others on
+            # Unix-like systems, but skip the chmod when the mode is already right
+            if (os.stat(dst).st_mode & 0o777) != 0o755:
+                os.chmod(dst, 0o755)  # rwxr-xr-x
+                log(f"Set executable permissions (0755) on {dst}")
         except Exception as e:
-            print(f"Warning: Could not set executable permissions on {dst}: {e}")
-            print("Binary may not be executable after installation.")
+            log(f"Warning: Could not set executable permissions on {dst}: {e}")
+            log("Binary may not be executable after installation.")
     else:
-        # On Windows, try to use Git Bash's chmod
-        set_executable_with_git_bash(dst)
+        # On Windows, set the ACL directly; only shell out to Git Bash if that fails
+        if not set_executable_acl(dst):
+            set_executable_with_git_bash(str(dst))
 
-# Create npm package
-def create_npm_package():
-    ensure_dir(NPM_DIR)
-    bin_dir = os.path.join(NPM_DIR, "bin")
-    ensure_dir(bin_dir)
-
-    # Copy binaries
-    for key, binary in BINARIES.items():
-        src = os.path.join(BINARY_DIR, binary)
-        if os.path.exists(src):
-            copy_binary(src, os.path.join(bin_dir, binary))
-
-    # Write package.json
-    with open(os.path.join(NPM_DIR, "package.json"), "w") as f:
-        f.write(f'''{{
+# Copy all prebuilt binaries into bin_dir, overlapping the I/O across threads
+def copy_binaries(bin_dir):
+    # One directory scan instead of a stat call per candidate binary
+    try:
+        present = {entry.name for entry in os.scandir(BINARY_DIR) if entry.is_file()}
+    except FileNotFoundError:
+        present = set()
+
+    to_copy = [binary for binary in BINARIES.values() if binary in present]
+    if not to_copy:
+        return
+
+    with ThreadPoolExecutor(max_workers=len(to_copy)) as executor:
+        list(executor.map(lambda binary: copy_binary(BINARY_DIR / binary, bin_dir / binary), to_copy))
+
+# Write a batch of generated files, overlapping the flushes across threads
+def write_files(items):
+    def write_one(item):
+        path, content = item
+        # One large-buffered handle per file: the content goes to the OS in a
+        # single flush, and utf-8 + "\n" keep the output identical on Windows
+        with open(path, "w", buffering=1 << 20, encoding="utf-8", newline="") as f:
+            f.write(content)
+
+    with ThreadPoolExecutor(max_workers=min(len(items), 4)) as executor:
+        list(executor.map(write_one, items))
+
+# Templates for the generated package sources, rendered in a single
+# substitute() pass (no post-render .replace sweep over the full string)
+PACKAGE_JSON_TEMPLATE = Template('''{
   "name": "ariana",
-  "version": "{VERSION}",
+  "version": "${VERSION}",
   "description": "Debug your JS/TS/Python code in development way faster than with a traditional debugger",
   "license": "AGPL-3.0-only",
-  "repository": {{
+  "repository": {
     "type": "git",
     "url": "https://github.com/dedale-dev/ariana.git"
-  }},
+  },
   "homepage": "https://ariana.dev",
-  "bin": {{
+  "bin": {
     "ariana": "./ariana.js"
-  }},
+  },
   "keywords": [
     "debugging",
     "ai",
@@ -142,9 +332,9 @@ def create_npm_package():
     "python",
     "react"
   ],
-  "scripts": {{
+  "scripts": {
     "postinstall": "node ./ariana.js install"
-  }},
+  },
   "files": [
     "bin",
     "bin/ariana-linux-x64",
@@ -154,13 +344,11 @@ def create_npm_package():
     "bin/ariana-windows-x64.exe",
     "ariana.js"
   ]
-}}
+}
 ''')
 
-    # Write ariana.js in the root directory, not in bin
-    with open(os.path.join(NPM_DIR, "ariana.js"), "w") as f:
-        f.write(f'''#!/usr/bin/env node
-const {{ execFileSync, spawnSync, spawn }} = require('child_process');
+ARIANA_JS_TEMPLATE = Template('''#!/usr/bin/env node
+const { spawn } = require('child_process');
 const path = require('path');
 const os = require('os');
 const fs = require('fs');
@@ -168,244 +356,261 @@ const https = require('https');
 
 const platform = os.platform();
 const arch = os.arch();
-const currentVersion = '{VERSION}';
+const currentVersion = '${VERSION}';
 
 // Function to check for the latest version
-function checkLatestVersion() {{
-  return new Promise((resolve) => {{
-    const options = {{
+function checkLatestVersion() {
+  return new Promise((resolve) => {
+    const options = {
       hostname: 'registry.npmjs.org',
       path: '/ariana',
       method: 'GET',
-      timeout: 3000
-    }};
+      timeout: 1500
+    };
 
-    const req = https.request(options, (res) => {{
+    const req = https.request(options, (res) => {
       let data = '';
-      res.on('data', (chunk) => {{
+      res.on('data', (chunk) => {
         data += chunk;
-      }});
-      res.on('end', () => {{
-        try {{
+      });
+      res.on('end', () => {
+        try {
           const packageInfo = JSON.parse(data);
           resolve(packageInfo['dist-tags']?.latest);
-        }} catch (e) {{
+        } catch (e) {
           resolve(null);
-        }}
-      }});
-    }});
+        }
+      });
+    });
 
-    req.on('error', () => {{
+    req.on('error', () => {
       resolve(null);
-    }});
+    });
 
-    req.on('timeout', () => {{
+    req.on('timeout', () => {
       req.destroy();
       resolve(null);
-    }});
+    });
 
     req.end();
-  }});
-}}
+  });
+}
 
 // Function to display version warning
-async function checkVersionAndWarn() {{
-  try {{
+async function checkVersionAndWarn() {
+  try {
     const latestVersion = await checkLatestVersion();
-    if (latestVersion && latestVersion !== '{VERSION}') {{
+    if (latestVersion && latestVersion !== '${VERSION}') {
       console.log('\\x1b[33m%s\\x1b[0m', '\\u26A0 WARNING: You are using an outdated version of Ariana CLI');
-      console.log('\\x1b[33m%s\\x1b[0m', `Your version: {VERSION}`);
-      console.log('\\x1b[33m%s\\x1b[0m', `Latest version: ${{latestVersion}}`);
+      console.log('\\x1b[33m%s\\x1b[0m', `Your version: ${VERSION}`);
+      console.log('\\x1b[33m%s\\x1b[0m', `Latest version: $${latestVersion}`);
       console.log('\\x1b[33m%s\\x1b[0m', 'Please update to the latest version using: npm install -g ariana@latest');
-    }}
-  }} catch (e) {{
+    }
+  } catch (e) {
     // Silently fail if version check fails
-  }}
-}}
+  }
+}
 
 let binaryName;
-if (platform === 'linux') {{
-  if (arch === 'arm64') {{
+if (platform === 'linux') {
+  if (arch === 'arm64') {
     binaryName = 'ariana-linux-arm64';
-  }} else if (arch === 'x64') {{
+  } else if (arch === 'x64') {
     binaryName = 'ariana-linux-x64';
-  }} else {{
+  } else {
     console.error('Unsupported Linux architecture');
     process.exit(1);
-  }}
-}} else if (platform === 'darwin') {{
-  if (arch === 'arm64') {{
+  }
+} else if (platform === 'darwin') {
+  if (arch === 'arm64') {
     binaryName = 'ariana-macos-arm64';
-  }} else if (arch === 'x64') {{
+  } else if (arch === 'x64') {
     binaryName = 'ariana-macos-x64';
-  }} else {{
+  } else {
     console.error('Unsupported macOS architecture');
     process.exit(1);
-  }}
-}} else if (platform === 'win32' && arch === 'x64') {{
+  }
+} else if (platform === 'win32' && arch === 'x64') {
   binaryName = 'ariana-windows-x64.exe';
-}} else {{
+} else {
   console.error('Unsupported platform or architecture');
   process.exit(1);
-}}
+}
 
 const binaryPath = path.join(__dirname, 'bin', binaryName);
 
 // Print some diagnostic info
-function printBinaryInfo() {{
+function printBinaryInfo() {
   console.log('Ariana binary information:');
-  console.log(`Binary path: ${{binaryPath}}`);
-  console.log(`Platform: ${{platform}}, Architecture: ${{arch}}`);
-  try {{
+  console.log(`Binary path: $${binaryPath}`);
+  console.log(`Platform: $${platform}, Architecture: $${arch}`);
+  try {
     const stats = fs.statSync(binaryPath);
-    console.log(`Binary exists: Yes, Size: ${{stats.size}} bytes, Mode: ${{stats.mode.toString(8)}}`);
-  }} catch (err) {{
-    console.log(`Binary exists: No (${{err.message}})`);
-  }}
-}}
+    console.log(`Binary exists: Yes, Size: $${stats.size} bytes, Mode: $${stats.mode.toString(8)}`);
+  } catch (err) {
+    console.log(`Binary exists: No ($${err.message})`);
+  }
+}
 
-if (process.argv[2] === 'install') {{
+if (process.argv[2] === 'install') {
   // Set executable permissions on Unix-like systems
-  if (platform === 'linux' || platform === 'darwin') {{
-    try {{
+  if (platform === 'linux' || platform === 'darwin') {
+    try {
       fs.chmodSync(binaryPath, 0o755);  // rwxr-xr-x
-      console.log(`Set executable permissions on ${{binaryPath}}`);
-    }} catch (err) {{
-      console.warn(`Warning: Could not set execute permissions on ${{binaryPath}}: ${{err.message}}`);
+      console.log(`Set executable permissions on $${binaryPath}`);
+    } catch (err) {
+      console.warn(`Warning: Could not set execute permissions on $${binaryPath}: $${err.message}`);
       console.warn('The binary might already be executable or permissions might be restricted.');
       // Continue anyway, as the binary might still be executable
-    }}
-  }}
+    }
+  }
   
   // Print diagnostic info during install
   printBinaryInfo();
   
   console.log('ariana binary installed successfully');
   process.exit(0);
-}}
+}
 
 // Check for version updates (don't await to avoid blocking)
-if (process.argv[2] !== 'version' && process.argv[2] !== '--version' && process.argv[2] !== '-v') {{
+if (process.argv[2] !== 'version' && process.argv[2] !== '--version' && process.argv[2] !== '-v') {
   checkVersionAndWarn();
-}}
+}
 
-try {{
+try {
   const args = process.argv.slice(2);
   
   // Use different execution strategies depending on platform
-  if (platform === 'win32') {{
-    // On Windows, execFileSync works well
-    try {{
-      execFileSync(binaryPath, args, {{ stdio: 'inherit' }});
-    }} catch (err) {{
+  if (platform === 'win32') {
+    // On Windows, spawn like the other platforms so Node exits with the child
+    // and the background version check can finish while the binary runs
+    const childProcess = spawn(binaryPath, args, {
+      stdio: 'inherit',
+      windowsHide: true
+    });
+
+    childProcess.on('error', (err) => {
       console.error(err.message);
+      printBinaryInfo();
       process.exit(1);
-    }}
-  }} else if (platform === 'darwin') {{
+    });
+
+    childProcess.on('exit', (code) => {
+      process.exit(code || 0);
+    });
+  } else if (platform === 'darwin') {
     // On macOS, try various methods starting with the most reliable
-    console.log(`Executing on macOS: ${{binaryPath}} with args: ${{args.join(' ')}}`);
+    console.log(`Executing on macOS: $${binaryPath} with args: $${args.join(' ')}`);
     
     // Method 1: Try /usr/bin/env approach (works well with macOS security)
-    try {{
+    try {
       const allArgs = [binaryPath].concat(args);
-      const childProcess = spawn('/usr/bin/env', allArgs, {{
+      const childProcess = spawn('/usr/bin/env', allArgs, {
         stdio: 'inherit'
-      }});
+      });
       
-      childProcess.on('error', (err) => {{
-        console.warn(`Warning: /usr/bin/env method failed: ${{err.message}}`);
+      childProcess.on('error', (err) => {
+        console.warn(`Warning: /usr/bin/env method failed: $${err.message}`);
         console.warn('Trying alternate method...');
         
         // Method 2: Try with shell: true as fallback
-        const shellProcess = spawn(binaryPath, args, {{
+        const shellProcess = spawn(binaryPath, args, {
           stdio: 'inherit',
           shell: true
-        }});
+        });
         
-        shellProcess.on('error', (shellErr) => {{
-          console.error(`Error starting process with shell: ${{shellErr.message}}`);
+        shellProcess.on('error', (shellErr) => {
+          console.error(`Error starting process with shell: $${shellErr.message}`);
           printBinaryInfo();
           process.exit(1);
-        }});
+        });
         
-        shellProcess.on('exit', (code) => {{
+        shellProcess.on('exit', (code) => {
           process.exit(code || 0);
-        }});
-      }});
+        });
+      });
       
-      childProcess.on('exit', (code) => {{
+      childProcess.on('exit', (code) => {
         process.exit(code || 0);
-      }});
-    }} catch (err) {{
-      console.error(`All execution methods failed for macOS: ${{err.message}}`);
+      });
+    } catch (err) {
+      console.error(`All execution methods failed for macOS: $${err.message}`);
       printBinaryInfo();
       process.exit(1);
-    }}
-  }} else {{
+    }
+  } else {
     // On Linux, use spawn with shell: true
-    console.log(`Executing on Linux: ${{binaryPath}} with args: ${{args.join(' ')}}`);
+    console.log(`Executing on Linux: $${binaryPath} with args: $${args.join(' ')}`);
     
-    const childProcess = spawn(binaryPath, args, {{
+    const childProcess = spawn(binaryPath, args, {
       stdio: 'inherit',
       shell: true
-    }});
+    });
     
-    childProcess.on('error', (err) => {{
-      console.error(`Error starting process: ${{err.message}}`);
+    childProcess.on('error', (err) => {
+      console.error(`Error starting process: $${err.message}`);
       printBinaryInfo();
       process.exit(1);
-    }});
+    });
     
-    childProcess.on('exit', (code) => {{
+    childProcess.on('exit', (code) => {
       process.exit(code || 0);
-    }});
-  }}
-}} catch (err) {{
+    });
+  }
+} catch (err) {
   console.error('Error running ariana:', err.message);
   printBinaryInfo();
   process.exit(1);
-}}
+}
 ''')
 
-    if platform.system().lower() != "windows":
-        os.chmod(os.path.join(NPM_DIR, "ariana.js"), 0o755)
-    else:
-        # On Windows, try to use Git Bash's chmod
-        set_executable_with_git_bash(os.path.join(NPM_DIR, "ariana.js"))
-    
-    print(f"npm package created in {NPM_DIR}. Run 'npm publish' from there to upload.")
-
-# Create pip package
-def create_pip_package():
-    ensure_dir(PIP_DIR)
-    pkg_dir = os.path.join(PIP_DIR, "ariana")
-    bin_dir = os.path.join(pkg_dir, "bin")
-    ensure_dir(bin_dir)
-
-    # Copy binaries
-    for key, binary in BINARIES.items():
-        src = os.path.join(BINARY_DIR, binary)
-        if os.path.exists(src):
-            copy_binary(src, os.path.join(bin_dir, binary))
-
-    # Write __init__.py
-    with open(os.path.join(pkg_dir, "__init__.py"), "w") as f:
-        f.write(f'''import os
+INIT_PY_TEMPLATE = Template('''import os
 import subprocess
 import sys
 import platform
+import functools
 import json
+import threading
+import time
 import urllib.request
 from urllib.error import URLError
 
+VERSION_CACHE_FILE = os.path.join(os.path.expanduser('~'), '.cache', 'ariana', 'latest.json')
+VERSION_CACHE_TTL = 6 * 60 * 60  # seconds
+
+def _read_cached_version():
+    try:
+        with open(VERSION_CACHE_FILE, 'r') as f:
+            cached = json.load(f)
+        if time.time() - cached.get('checked_at', 0) < VERSION_CACHE_TTL:
+            return cached.get('version')
+    except (OSError, ValueError):
+        pass
+    return None
+
+def _write_cached_version(version):
+    try:
+        os.makedirs(os.path.dirname(VERSION_CACHE_FILE), exist_ok=True)
+        with open(VERSION_CACHE_FILE, 'w') as f:
+            json.dump({'version': version, 'checked_at': time.time()}, f)
+    except OSError:
+        pass
+
+@functools.lru_cache(maxsize=1)
 def check_latest_version():
+    cached = _read_cached_version()
+    if cached is not None:
+        return cached
     try:
         url = "https://pypi.org/pypi/ariana/json"
-        with urllib.request.urlopen(url, timeout=3) as response:
+        with urllib.request.urlopen(url, timeout=1.5) as response:
             data = json.loads(response.read().decode())
-            return data.get("info", {{}}).get("version")
+            version = data.get("info", {}).get("version")
+            if version:
+                _write_cached_version(version)
+            return version
     except (URLError, json.JSONDecodeError, KeyError) as e:
-        print(f"Warning: Failed to check for latest version: {{e}}")
+        print(f"Warning: Failed to check for latest version: {e}")
         return None
 
 def main():
@@ -437,7 +642,7 @@ def main():
         sys.exit(1)
 
     if not os.path.exists(binary):
-        print(f"Error: Binary file not found at {{binary}}")
+        print(f"Error: Binary file not found at {binary}")
         print("This may be due to a packaging issue or incomplete installation.")
         print("Please try reinstalling the package with: pip install --force-reinstall ariana")
         sys.exit(1)
@@ -446,87 +651,146 @@ def main():
         try:
             os.chmod(binary, 0o755)
         except Exception as e:
-            print(f"Warning: Could not set execute permissions on {{binary}}: {{e}}")
+            print(f"Warning: Could not set execute permissions on {binary}: {e}")
             # Continue anyway, the binary might already be executable
 
-    try:
-        latest_version = check_latest_version()
-        if latest_version and latest_version != '{VERSION}':
+    # Check the registry on a daemon thread so CLI startup never waits on the network
+    version_result = []
+    version_thread = threading.Thread(target=lambda: version_result.append(check_latest_version()), daemon=True)
+    version_thread.start()
+
+    process = subprocess.Popen([binary] + sys.argv[1:])
+    return_code = process.wait()
+
+    # Only warn if the check finished while the binary was running; otherwise drop it
+    version_thread.join(timeout=0)
+    if not version_thread.is_alive() and version_result:
+        latest_version = version_result[0]
+        if latest_version and latest_version != '${VERSION}':
             print('\\033[33m\\u26A0  WARNING: You are using an outdated version of Ariana CLI\\033[0m')
-            print(f'\\033[33mYour version: {{VERSION}}\\033[0m')
-            print(f'\\033[33mLatest version: {{latest_version}}\\033[0m')
+            print(f'\\033[33mYour version: ${VERSION}\\033[0m')
+            print(f'\\033[33mLatest version: {latest_version}\\033[0m')
             print('\\033[33mPlease update to the latest version using: pip install --upgrade ariana\\033[0m')
-    except Exception:
-        # Silently fail if version check fails
-        pass
 
-    try:
-        subprocess.run([binary] + sys.argv[1:], check=True)
-    except subprocess.CalledProcessError as e:
-        sys.exit(1)
+    if return_code != 0:
+        sys.exit(return_code)
 
 if __name__ == '__main__':
     main()
-'''.replace('{VERSION}', VERSION))
+''')
 
-    # Write setup.py
-    with open(os.path.join(PIP_DIR, "setup.py"), "w") as f:
-        f.write(f'''from setuptools import setup
+SETUP_PY_TEMPLATE = Template('''from setuptools import setup
 import sys
 import platform
 
 setup(
     name='ariana',
-    version='{VERSION}',
+    version='${VERSION}',
     description='Debug your JS/TS/Python code in development way faster than with a traditional debugger',
     packages=['ariana'],
-    package_data={{
+    package_data={
         'ariana': ['bin/ariana-linux-x64', 'bin/ariana-linux-arm64', 'bin/ariana-macos-x64', 'bin/ariana-macos-arm64', 'bin/ariana-windows-x64.exe'],
-    }},
-    entry_points={{
+    },
+    entry_points={
         'console_scripts': [
             'ariana = ariana:main',
         ],
-    }},
+    },
     license='AGPL-3.0-only',
     url='https://github.com/dedale-dev/ariana',
 )
-'''.replace('{VERSION}', VERSION))
+''')
 
-    print(f"pip package created in {PIP_DIR}. Run 'python -m build' and 'twine upload dist/*' to upload.")
+# Create npm package
+def create_npm_package():
+    version = get_version_from_cargo()
+    ensure_dir(NPM_DIR)
+    bin_dir = NPM_DIR / "bin"
+    ensure_dir(bin_dir)
+
+    # Copy binaries
+    copy_binaries(bin_dir)
+
+    package_json = PACKAGE_JSON_TEMPLATE.substitute(VERSION=version)
+
+    ariana_js = ARIANA_JS_TEMPLATE.substitute(VERSION=version)
+
+    write_files([
+        (NPM_DIR / "package.json", package_json),
+        (NPM_DIR / "ariana.js", ariana_js),
+    ])
+
+    if not IS_WINDOWS:
+        os.chmod(NPM_DIR / "ariana.js", 0o755)
+    else:
+        # On Windows, set the ACL directly; only shell out to Git Bash if that fails
+        if not set_executable_acl(NPM_DIR / "ariana.js"):
+            set_executable_with_git_bash(str(NPM_DIR / "ariana.js"))
+    
+    log(f"npm package created in {NPM_DIR}. Run 'npm publish' from there to upload.")
+
+# Create pip package
+def create_pip_package():
+    version = get_version_from_cargo()
+    ensure_dir(PIP_DIR)
+    pkg_dir = PIP_DIR / "ariana"
+    bin_dir = pkg_dir / "bin"
+    ensure_dir(bin_dir)
+
+    # Copy binaries
+    copy_binaries(bin_dir)
+
+    init_py = INIT_PY_TEMPLATE.substitute(VERSION=version)
+
+    setup_py = SETUP_PY_TEMPLATE.substitute(VERSION=version)
+
+    write_files([
+        (pkg_dir / "__init__.py", init_py),
+        (PIP_DIR / "setup.py", setup_py),
+    ])
+
+    log(f"pip package created in {PIP_DIR}. Run 'python -m build' and 'twine upload dist/*' to upload.")
 
 # Copy README.md from VS Code extension to npm and pip packages
 def copy_readme():
     print("Copying README.md from VS Code extension...")
-    if not os.path.exists(VSCODE_README_PATH):
+    if not VSCODE_README_PATH.exists():
         print(f"Error: VS Code README not found at {VSCODE_README_PATH}")
         return False
 
-    # Copy to npm package
-    npm_readme_path = os.path.join(NPM_DIR, "README.md")
-    shutil.copy(VSCODE_README_PATH, npm_readme_path)
-    print(f"README.md copied to {npm_readme_path}")
+    # One read feeds both packages, written in parallel like the binary copies
+    readme = VSCODE_README_PATH.read_bytes()
+    destinations = [NPM_DIR / "README.md", PIP_DIR / "README.md"]
+    with ThreadPoolExecutor(max_workers=len(destinations)) as executor:
+        list(executor.map(lambda dst: dst.write_bytes(readme), destinations))
+    for dst in destinations:
+        log(f"README.md copied to {dst}")
 
-    # Copy to pip package
-    pip_readme_path = os.path.join(PIP_DIR, "README.md")
-    shutil.copy(VSCODE_README_PATH, pip_readme_path)
-    print(f"README.md copied to {pip_readme_path}")
-    
     return True
 
 # Main execution
 def main():    
-    if not os.path.exists(BINARY_DIR):
+    if not BINARY_DIR.exists():
         print(f"Error: Directory '{BINARY_DIR}' with binaries not found.")
         sys.exit(1)
 
-    print("Creating npm package...")
-    create_npm_package()
-    print("Creating pip package...")
-    create_pip_package()
+    cache_key = package_inputs_key()
+    if package_cache_hit(cache_key):
+        print("Packages are up to date (inputs unchanged). Delete .ariana_package_cache to force a rebuild.")
+        sys.exit(0)
+
+    # The two packagers only touch their own directories, so run them side by side
+    log("Creating npm and pip packages...")
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [executor.submit(create_npm_package), executor.submit(create_pip_package)]
+        wait(futures)
+        for future in futures:
+            future.result()
     
     print("Copying README files...")
     copy_readme()
+
+    write_package_cache(cache_key)
     
     print("\nNext steps:")
     print(f"- For npm: cd {NPM_DIR} && npm login && npm publish --access public")
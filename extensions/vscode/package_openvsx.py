@@ -7,20 +7,20 @@ PACKAGE_JSON = Path("package.json")
 ORIGINAL_PACKAGE_JSON = Path("package.json.bak")
 OUTPUT_DIR = Path("packaged/openvsx")
 VSIX_NAME = "ariana-openvsx.vsix"
+# Resolve vsce once instead of hard-coding a machine-specific path
+VSCE = shutil.which("vsce") or shutil.which("vsce.cmd") or "vsce"
 
 def modify_package_json():
     """Modify package.json to change the publisher to 'ariana'."""
-    with PACKAGE_JSON.open("r", encoding="utf-8") as f:
-        data = json.load(f)
-    
-    # Backup original package.json
-    shutil.copy(PACKAGE_JSON, ORIGINAL_PACKAGE_JSON)
-    
+    # Read once: the same bytes serve as the backup and the parse input
+    original = PACKAGE_JSON.read_bytes()
+    ORIGINAL_PACKAGE_JSON.write_bytes(original)
+
     # Modify publisher
+    data = json.loads(original)
     data["publisher"] = "ariana"
-    
-    with PACKAGE_JSON.open("w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+
+    PACKAGE_JSON.write_text(json.dumps(data, indent=2), encoding="utf-8")
 
 def restore_package_json():
     """Restore the original package.json."""
@@ -30,10 +30,10 @@ def restore_package_json():
 def package_extension():
     """Run the vsce package command and move output to the target directory."""
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-    
+
     # Run VSCE package
-    subprocess.run(["C:\\Users\\mr003\\AppData\\Local\\pnpm\\vsce.cmd", "package", "--out", VSIX_NAME], check=True)
-    
+    subprocess.run([VSCE, "package", "--out", VSIX_NAME], check=True)
+
     # Move .vsix to the correct location
     shutil.move(VSIX_NAME, OUTPUT_DIR / VSIX_NAME)
 
@@ -0,0 +1,65 @@
+import os
+import re
+from string import Template
+
+# Generates a dev-only React component that previews every theme color
+# variable defined in webview-ui/src/styles/theme.css. Run it after adding
+# or renaming variables, then render <ColorPalette /> in the webview to
+# eyeball the palette against the current VS Code theme.
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+THEME_CSS_PATH = os.path.join(SCRIPT_DIR, "..", "webview-ui", "src", "styles", "theme.css")
+OUTPUT_PATH = os.path.join(SCRIPT_DIR, "..", "webview-ui", "src", "components", "dev", "ColorPalette.tsx")
+
+HEADER = """import React from 'react';
+
+// Generated by scripts/generate_color_component.py -- do not edit by hand.
+const ColorPalette: React.FC = () => (
+  <div className="p-4 flex flex-col gap-1">
+"""
+
+FOOTER = """  </div>
+);
+
+export default ColorPalette;
+"""
+
+COLOR_VAR_RE = re.compile(r'(--[\w-]+)\s*:')
+
+SWATCH_TEMPLATE = Template("""    <div className="flex items-center gap-2">
+      <div className="h-6 w-6 rounded-sm border border-[var(--border-base)]" style={{ backgroundColor: 'var(${var_name})' }} />
+      <span className="text-xs">${var_name}</span>
+    </div>
+""")
+
+
+def read_color_vars(path):
+    # One read + C-level splitlines instead of readlines plus a strip pass
+    with open(path, 'r') as f:
+        lines = filter(None, map(str.strip, f.read().splitlines()))
+    return [match.group(1) for match in map(COLOR_VAR_RE.match, lines) if match]
+
+
+def generate_color_component(color_vars):
+    # Render each swatch in one substitute() pass over the precompiled template,
+    # then join the batch once; no brace escaping needed around the JSX
+    parts = [HEADER]
+    parts.extend(SWATCH_TEMPLATE.substitute(var_name=var_name) for var_name in color_vars)
+    parts.append(FOOTER)
+    return ''.join(parts)
+
+
+def main():
+    color_vars = read_color_vars(THEME_CSS_PATH)
+    if not color_vars:
+        print(f"Error: No color variables found in {THEME_CSS_PATH}")
+        return
+
+    os.makedirs(os.path.dirname(OUTPUT_PATH), exist_ok=True)
+    with open(OUTPUT_PATH, 'w') as f:
+        f.write(generate_color_component(color_vars))
+    print(f"Wrote {len(color_vars)} swatches to {OUTPUT_PATH}")
+
+
+if __name__ == "__main__":
+    main()